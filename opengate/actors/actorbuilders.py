@@ -1,44 +1,68 @@
-from .arfactors import ARFActor, ARFTrainingDatasetActor
-from .doseactors import DoseActor, LETActor
-from .digitizers import (
-    DigitizerAdderActor,
-    DigitizerReadoutActor,
-    DigitizerHitsCollectionActor,
-    DigitizerEnergyWindowsActor,
-    DigitizerProjectionActor,
-    DigitizerBlurringActor,
-    DigitizerSpatialBlurringActor,
-    DigitizerEfficiencyActor,
-    PhaseSpaceActor,
-)
-from .miscactors import (
-    MotionVolumeActor,
-    SimulationStatisticsActor,
-    SourceInfoActor,
-    TestActor,
-    KillActor,
-)
 from ..utility import make_builders
 
+# Cache for the lazily imported actor types and builders.
+# The actor modules pull in heavy dependencies (opengate_core, numpy, itk),
+# so they are only imported when the actor types are actually needed,
+# not when this module is loaded.
+_actor_type_names = None
+_actor_builders = None
 
-actor_type_names = {
-    SimulationStatisticsActor,
-    DoseActor,
-    LETActor,
-    SourceInfoActor,
-    PhaseSpaceActor,
-    DigitizerHitsCollectionActor,
-    DigitizerAdderActor,
-    DigitizerEnergyWindowsActor,
-    DigitizerProjectionActor,
-    DigitizerReadoutActor,
-    DigitizerBlurringActor,
-    DigitizerSpatialBlurringActor,
-    DigitizerEfficiencyActor,
-    MotionVolumeActor,
-    ARFActor,
-    ARFTrainingDatasetActor,
-    TestActor,
-    KillActor,
-}
-actor_builders = make_builders(actor_type_names)
+
+def _import_actor_type_names():
+    from .arfactors import ARFActor, ARFTrainingDatasetActor
+    from .doseactors import DoseActor, LETActor
+    from .digitizers import (
+        DigitizerAdderActor,
+        DigitizerReadoutActor,
+        DigitizerHitsCollectionActor,
+        DigitizerEnergyWindowsActor,
+        DigitizerProjectionActor,
+        DigitizerBlurringActor,
+        DigitizerSpatialBlurringActor,
+        DigitizerEfficiencyActor,
+        PhaseSpaceActor,
+    )
+    from .miscactors import (
+        MotionVolumeActor,
+        SimulationStatisticsActor,
+        SourceInfoActor,
+        TestActor,
+        KillActor,
+    )
+
+    return (
+        SimulationStatisticsActor,
+        DoseActor,
+        LETActor,
+        SourceInfoActor,
+        PhaseSpaceActor,
+        DigitizerHitsCollectionActor,
+        DigitizerAdderActor,
+        DigitizerEnergyWindowsActor,
+        DigitizerProjectionActor,
+        DigitizerReadoutActor,
+        DigitizerBlurringActor,
+        DigitizerSpatialBlurringActor,
+        DigitizerEfficiencyActor,
+        MotionVolumeActor,
+        ARFActor,
+        ARFTrainingDatasetActor,
+        TestActor,
+        KillActor,
+    )
+
+
+def __getattr__(name):
+    """Module-level getattr (PEP 562) which imports the actor modules
+    only on first access to actor_type_names or actor_builders.
+    """
+    global _actor_type_names, _actor_builders
+    if name == "actor_type_names":
+        if _actor_type_names is None:
+            _actor_type_names = _import_actor_type_names()
+        return _actor_type_names
+    if name == "actor_builders":
+        if _actor_builders is None:
+            _actor_builders = make_builders(__getattr__("actor_type_names"))
+        return _actor_builders
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
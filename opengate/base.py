@@ -1,5 +1,6 @@
 import copy
 from pathlib import Path
+from types import MappingProxyType
 
 from box import Box
 import sys
@@ -106,7 +107,15 @@ def digest_user_info_defaults(cls):
     # FIXME: Check if we should actually process all class in the MRO
     # rather than accumulating user info defaults?
     cls = add_properties_to_class(cls, inherited_user_info_defaults)
-    cls.inherited_user_info_defaults = inherited_user_info_defaults
+    # freeze the accumulated defaults: they are shared class-level state
+    # and must not be mutated accidentally after class creation
+    cls.inherited_user_info_defaults = MappingProxyType(inherited_user_info_defaults)
+    # flat precomputed (name, default, options) tuples for the __init__
+    # hot loop; avoids unpacking the (default, options) pairs on every
+    # object construction
+    cls._processed_user_info_defaults = tuple(
+        (k, v[0], v[1]) for k, v in inherited_user_info_defaults.items()
+    )
     make_docstring(cls, inherited_user_info_defaults)
     return cls
 
@@ -249,9 +258,7 @@ def attach_methods(GateObjectClass):
 
     def __init__(self, *args, **kwargs):
         self.user_info = Box()
-        for k, v in self.inherited_user_info_defaults.items():
-            default_value = v[0]
-            options = v[1]
+        for k, default_value, options in self._processed_user_info_defaults:
             if k in kwargs:
                 # if "check_func" in options.keys():
                 #     user_info_value = options["check_func"](kwargs[k])
@@ -264,7 +271,15 @@ def attach_methods(GateObjectClass):
                     fatal(
                         f"No value provided for argument '{k}', but required when constructing a {type(self).__name__} object."
                     )
-                user_info_value = copy.deepcopy(default_value)
+                # scalar defaults are immutable and can be shared;
+                # only container defaults need the (costly) deep copy to
+                # avoid shared mutable state between instances
+                if default_value is None or isinstance(
+                    default_value, (str, int, float, bool, bytes)
+                ):
+                    user_info_value = default_value
+                else:
+                    user_info_value = copy.deepcopy(default_value)
             self.user_info[k] = user_info_value
         super(GateObjectClass, self).__init__()
 
@@ -404,33 +419,34 @@ def recursive_userinfo_to_dict(obj):
 def find_paths_in_gate_object_dictionary(go_dict, only_input_files=False):
     paths = []
     for ui_name, ui in go_dict["user_info"].items():
-        new_paths = find_all_paths(ui)
+        # check the options first: if the user info is pruned anyway,
+        # there is no point in descending into its value
         if only_input_files is True:
             options = _get_user_info_options(
                 ui_name, go_dict["object_type"], go_dict["class_module"]
             )
-            try:
-                consider_this = options["is_input_file"]
-            except KeyError:
-                consider_this = False
-        else:
-            consider_this = True
-        if consider_this is True:
-            paths.extend(new_paths)
+            if options.get("is_input_file", False) is not True:
+                continue
+        paths.extend(find_all_paths(ui))
     return paths
 
 
-def recursively_search_object(obj, condition=(lambda x: True)):
-    found_objects = []
+def _iter_matching_objects(obj, condition):
+    """Generator which yields all (nested) items in obj satisfying
+    the condition, in a single descent without intermediate lists.
+    """
     if condition(obj) is True:
-        found_objects.append(obj)
+        yield obj
     if isinstance(obj, __gate_dictionary_objects__):
         for v in obj.values():
-            found_objects.extend(recursively_search_object(v, condition=condition))
+            yield from _iter_matching_objects(v, condition)
     if isinstance(obj, __gate_list_objects__):
         for e in obj:
-            found_objects.extend(recursively_search_object(e, condition=condition))
-    return found_objects
+            yield from _iter_matching_objects(e, condition)
+
+
+def recursively_search_object(obj, condition=(lambda x: True)):
+    return list(_iter_matching_objects(obj, condition))
 
 
 def find_all_gate_objects(dct):
@@ -1,4 +1,5 @@
 import pathlib
+import numpy as np
 from opengate.exception import fatal
 from opengate.utility import g4_units
 
@@ -6,7 +7,6 @@ from opengate.geometry.volumes import RepeatParametrisedVolume, HexagonVolume
 from opengate.geometry.utility import (
     translate_point_to_volume,
     get_transform_orbiting,
-    vec_g4_as_np,
 )
 
 # unit
@@ -426,12 +426,13 @@ def add_digitizer_energy_windows(sim, crystal_volume_name, channels):
 def get_volume_position_in_head(sim, spect_name, vol_name, pos="max"):
     vol = sim.volume_manager.volumes[f"{spect_name}_{vol_name}"]
     pMin, pMax = vol.bounding_limits
+    pMin = np.asarray(pMin)
+    pMax = np.asarray(pMax)
     x = pMax
     if pos == "min":
         x = pMin
     if pos == "center":
         x = pMin + (pMax - pMin) / 2.0
-    x = vec_g4_as_np(x)
     x = translate_point_to_volume(sim, vol, spect_name, x)
     return x[2]
 
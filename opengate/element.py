@@ -1,28 +1,61 @@
 import copy
-from .sources.builders import source_builders, source_type_names
-from .actors.actorbuilders import actor_builders, actor_type_names
-from .actors.builders import filter_builders, filter_type_names
+from functools import lru_cache
+
 from .exception import fatal
 
+known_element_types = ("Source", "Actor", "Filter")
 
-element_builders = {
-    "Source": source_builders,
-    "Actor": actor_builders,
-    "Filter": filter_builders,
-}
 
+def _get_type_names(element_type):
+    """Return the list of element classes for the given element type.
 
-def get_element_class(element_type, type_name):
+    The builder modules are imported here rather than at module level so that
+    the (heavy) source/actor/filter modules are only loaded when an element
+    is actually created.
     """
-    Return the class of the given type_name (in the element_type list)
+    if element_type == "Source":
+        from .sources.builders import source_type_names
+
+        return source_type_names
+    if element_type == "Actor":
+        from .actors.actorbuilders import actor_type_names
+
+        return actor_type_names
+    if element_type == "Filter":
+        from .actors.builders import filter_type_names
+
+        return filter_type_names
+    return None
+
+
+def _get_element_builders(element_type):
+    """Return the builder dictionary for the given element type.
+    See _get_type_names() concerning the lazy imports.
     """
-    elements = None
     if element_type == "Source":
-        elements = source_type_names
+        from .sources.builders import source_builders
+
+        return source_builders
     if element_type == "Actor":
-        elements = actor_type_names
+        from .actors.actorbuilders import actor_builders
+
+        return actor_builders
     if element_type == "Filter":
-        elements = filter_type_names
+        from .actors.builders import filter_builders
+
+        return filter_builders
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_element_class(element_type, type_name):
+    """
+    Return the class of the given type_name (in the element_type list)
+
+    The result is memoized: every UserInfo construction looks up its class
+    here, and the underlying search is a linear scan over the type names.
+    """
+    elements = _get_type_names(element_type)
     if not elements:
         fatal(
             f"Error, element_type={element_type} is   unknown. Use Volume, Source or Actor."
@@ -48,12 +81,12 @@ def get_builder(element_type, type_name):
     Check everything first.
     """
     # get type of element builder
-    if element_type not in element_builders:
+    if element_type not in known_element_types:
         fatal(
             f"The element type: {element_type} is unknown.\n"
-            f"Known element types are {element_builders.keys()}"
+            f"Known element types are {known_element_types}"
         )
-    builders = element_builders[element_type]
+    builders = _get_element_builders(element_type)
     # get builder
     if type_name not in builders:
         fatal(
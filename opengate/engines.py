@@ -630,7 +630,7 @@ class ActorEngine(EngineBase):
             self.simulation_engine_wr().simulation.actor_manager.user_info_actors.values()
         ):
             actor = new_element(ui, self.simulation_engine_wr().simulation)
-            log.debug(f"Actor: initialize [{ui.type_name}] {ui.name}")
+            log.debug("Actor: initialize [%s] %s", ui.type_name, ui.name)
             actor.initialize(self.simulation_engine_wr)
             self.actors[ui.name] = actor
 
@@ -649,7 +649,9 @@ class ActorEngine(EngineBase):
         # for actor in self.actors.values():
         for actor in sorted_actors:
             log.debug(
-                f"Actor: initialize [{actor.user_info.type_name}] {actor.user_info.name}"
+                "Actor: initialize [%s] %s",
+                actor.user_info.type_name,
+                actor.user_info.name,
             )
             self.register_all_actions(actor)
             # warning : the step actions will be registered by register_sensitive_detectors
@@ -694,9 +696,10 @@ class ActorEngine(EngineBase):
 
     def register_sensitive_detector_to_children(self, actor, lv):
         log.debug(
-            f'Actor: "{actor.user_info.name}" '
-            f'(attached to "{actor.user_info.mother}") '
-            f'set to volume "{lv.GetName()}"'
+            'Actor: "%s" (attached to "%s") set to volume "%s"',
+            actor.user_info.name,
+            actor.user_info.mother,
+            lv.GetName(),
         )
         actor.RegisterSD(lv)
         for i in range(lv.GetNoDaughters()):
@@ -783,7 +786,7 @@ class VolumeEngine(g4.G4VUserDetectorConstruction, EngineBase):
             self.RegisterParallelWorld(self.parallel_world_engines[parallel_world_name])
 
     def register_to_volumes(self):
-        self.volume_manager.update_volume_tree()
+        self.volume_manager.update_volume_tree_if_needed()
         for volume in PreOrderIter(self.volume_manager.volume_tree_root):
             volume.volume_engine = self
 
@@ -1188,7 +1191,7 @@ class SimulationEngine(EngineBase):
         s = ""
         if self.new_process:
             s = "(in a new process)"
-        log.info("-" * 80 + f"\nSimulation: START {s}")
+        log.info("%s\nSimulation: START %s", "-" * 80, s)
 
         # actor: start simulation (only the master thread)
         self.actor_engine.start_simulation()
@@ -1203,10 +1206,12 @@ class SimulationEngine(EngineBase):
 
         # this is the end
         log.info(
-            f"Simulation: STOP. Run: {len(self.run_timing_intervals)}. "
-            # f'Events: {self.source_manager.total_events_count}. '
-            f"Time: {end - start:0.1f} seconds.\n"
-            + f"-" * 80
+            "Simulation: STOP. Run: %d. "
+            # 'Events: %s.' % self.source_manager.total_events_count
+            "Time: %0.1f seconds.\n%s",
+            len(self.run_timing_intervals),
+            end - start,
+            "-" * 80,
         )
 
     def initialize_random_engine(self):
@@ -1372,7 +1377,8 @@ class SimulationEngine(EngineBase):
                 )
 
             log.info(
-                f"Simulation: create MTRunManager with {self.simulation.number_of_threads} threads"
+                "Simulation: create MTRunManager with %s threads",
+                self.simulation.number_of_threads,
             )
             self.g4_RunManager = g4.WrappedG4MTRunManager()
             self.g4_RunManager.SetNumberOfThreads(self.simulation.number_of_threads)
@@ -1400,7 +1406,7 @@ class SimulationEngine(EngineBase):
     def apply_g4_command(self, command):
         if self.g4_ui is None:
             self.g4_ui = g4.G4UImanager.GetUIpointer()
-        log.info(f"Simulation: apply G4 command '{command}'")
+        log.info("Simulation: apply G4 command '%s'", command)
         code = self.g4_ui.ApplyCommand(command)
         if code == 0:
             return
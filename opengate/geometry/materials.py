@@ -512,6 +512,9 @@ class MaterialDatabase:
     def __init__(self):
         # list of all db filenames where to read material
         self.filenames = []
+        # shadow set of the filenames for O(1) duplicate checks;
+        # the list remains the source of truth (keeps insertion order)
+        self._filenames_set = set()
         # list of all read material (not build)
         self.material_builders = {}
         self.material_builders_by_filename = {}
@@ -532,9 +535,13 @@ class MaterialDatabase:
         self.g4_NistManager = None
         self.nist_material_names = None
         self.nist_element_names = None
+        # set versions of the NIST name lists for fast membership tests
+        self._nist_material_names_set = None
+        self._nist_element_names_set = None
 
     def read_from_file(self, filename):
         self.filenames.append(filename)
+        self._filenames_set.add(filename)
         self.current_filename = filename
         self.element_builders_by_filename[self.current_filename] = {}
         self.material_builders_by_filename[self.current_filename] = {}
@@ -582,6 +589,10 @@ class MaterialDatabase:
             self.g4_NistManager = g4.G4NistManager.Instance()
             self.nist_material_names = self.g4_NistManager.GetNistMaterialNames()
             self.nist_element_names = self.g4_NistManager.GetNistElementNames()
+            # the name lists come from C++ as sequences; membership tests on
+            # them are linear scans, so keep set versions for the lookups
+            self._nist_material_names_set = set(self.nist_material_names)
+            self._nist_element_names_set = set(self.nist_element_names)
             self.material_builders_by_filename["NIST"] = self.nist_material_names
             self.element_builders_by_filename["NIST"] = self.nist_element_names
 
@@ -631,13 +642,15 @@ class MaterialDatabase:
         self.new_materials_weights = []
 
     def FindOrBuildMaterial(self, material_name):
+        # return if already exist (fast path, before the init checks)
+        try:
+            return self.g4_materials[material_name]
+        except KeyError:
+            pass
         self.init_NIST()
         self.init_user_mat()
-        # return if already exist
-        if material_name in self.g4_materials:
-            return self.g4_materials[material_name]
         # we build and store the G4 material if not
-        if material_name in self.nist_material_names:
+        if material_name in self._nist_material_names_set:
             bm = self.g4_NistManager.FindOrBuildMaterial(material_name)
             self.g4_materials[material_name] = bm
             return bm
@@ -648,12 +661,14 @@ class MaterialDatabase:
         return bm
 
     def FindOrBuildElement(self, element_name):
-        self.init_NIST()
-        # return if already exist
-        if element_name in self.g4_elements.keys():
+        # return if already exist (fast path, before the init checks)
+        try:
             return self.g4_elements[element_name]
+        except KeyError:
+            pass
+        self.init_NIST()
         # we build and store the G4 element if not
-        if element_name in self.nist_element_names:
+        if element_name in self._nist_element_names_set:
             be = self.g4_NistManager.FindOrBuildElement(element_name)
             self.g4_elements[element_name] = be
             return be
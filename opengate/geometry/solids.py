@@ -1,4 +1,7 @@
-from box import Box
+from collections import namedtuple
+import threading
+
+import numpy as np
 from scipy.spatial.transform import Rotation
 import sys
 
@@ -13,52 +16,207 @@ from .utility import (
     ensure_is_g4_translation,
 )
 
+# units used by the default user infos below;
+# resolved once here instead of via a g4_units lookup at every use
+mm = g4_units.mm
+cm = g4_units.cm
+deg = g4_units.deg
+
+# full-circle angles, precomputed once at import
+_full_circle_start = 0 * deg
+_full_circle = 360 * deg
+
+# lightweight immutable container for the cached solid properties
+SolidInfo = namedtuple(
+    "SolidInfo",
+    ["cubic_volume", "surface_area", "bounding_limits", "bounding_box_size"],
+)
+
+# scratch pair of G4ThreeVector reused by solid_info computations;
+# thread-local because BoundingLimits fills them in place
+_scratch_vectors = threading.local()
+
+
+def _get_scratch_vectors():
+    try:
+        return _scratch_vectors.pair
+    except AttributeError:
+        _scratch_vectors.pair = (g4.G4ThreeVector(), g4.G4ThreeVector())
+        return _scratch_vectors.pair
+
+
+# flyweight cache: solids of the same type with identical user infos
+# (apart from the name) have identical properties, so the computed
+# SolidInfo records are shared across instances
+_solid_info_flyweight = {}
+# keep the flyweight bounded; entries are small (a few floats each), but a
+# long-lived process generating many distinct geometries should not grow
+# the dict forever
+_solid_info_flyweight_max_size = 1000
+
+# user info values accepted as-is when freezing; anything else (in
+# particular GateObjects such as the creator volumes of boolean solids)
+# must not end up in the process-global flyweight dict, where it would be
+# kept alive forever and could pin a whole Simulation via back-references
+_plain_value_types = (type(None), str, int, float, bool, bytes)
+
+
+def _freeze_value(value):
+    """Recursively convert a user info value into a hashable representation.
+    Raises TypeError if the value is not plain data.
+    """
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, _freeze_value(v)) for k, v in value.items())
+    if isinstance(value, _plain_value_types):
+        return value
+    raise TypeError(f"Cannot freeze user info value of type {type(value)}.")
+
 
 class SolidBase(GateObject):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.g4_solid = None
+        self._solid_info_cache = None
+        # frozen user-info key the cache was computed with; used to detect
+        # in-place mutations which bypass __setattr__
+        self._solid_info_cache_key = None
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Changing a user info (e.g. the size of a box) invalidates the solid,
+        # so any cached info derived from it must be recomputed.
+        if name in self.inherited_user_info_defaults:
+            self._mark_dirty()
+
+    def _mark_dirty(self):
+        """Single invalidation hook: drop all cached quantities derived from
+        the user infos. Subclasses with additional caches should override this
+        (and call super()._mark_dirty()).
+        """
+        self._solid_info_cache = None
+        self._solid_info_cache_key = None
+        self.g4_solid = None
 
     def close(self):
         self.release_g4_references()
 
     def release_g4_references(self):
         self.g4_solid = None
+        self._solid_info_cache = None
+        self._solid_info_cache_key = None
+
+    def __getstate__(self):
+        # the G4 solid is an unpicklable pybind object; it is rebuilt on
+        # demand after unpickling (same pattern as PhysicsListManager)
+        return_dict = dict(self.__dict__)
+        return_dict["g4_solid"] = None
+        return return_dict
 
     @property
     def solid_info(self):
-        """Computes the properties of the solid associated with this volume."""
+        """Computes the properties of the solid associated with this volume.
+
+        The cached result is validated against a frozen snapshot of the
+        user infos, so it is recomputed both after attribute assignment and
+        after in-place mutation of a user info (e.g. ``box.size[2] = ...``).
+        Solids whose user infos cannot be frozen into such a snapshot are
+        recomputed on every access.
+        """
         # Note: This method only works in derived classes which implement the build_solid method.
+        key = self._solid_info_key()
+        if key is not None:
+            if self._solid_info_cache is not None and key == self._solid_info_cache_key:
+                return self._solid_info_cache
+            cached = _solid_info_flyweight.get(key)
+            if cached is not None:
+                self._solid_info_cache = cached
+                self._solid_info_cache_key = key
+                return cached
+        # build a throwaway solid: the info only needs plain floats,
+        # and retaining the (unpicklable) G4 object here would break
+        # pickling of simulations queried before a subprocess run
         solid = self.build_solid()
         if solid is None:
             fatal(
                 f"Cannot compute solid info for this volume {self.name}. Unable to build the solid."
             )
-        r = Box()
-        r.cubic_volume = solid.GetCubicVolume()
-        r.surface_area = solid.GetSurfaceArea()
-        pMin = g4.G4ThreeVector()
-        pMax = g4.G4ThreeVector()
+        # only plain floats are extracted from the scratch vectors below,
+        # so they can safely be reused across calls
+        pMin, pMax = _get_scratch_vectors()
         solid.BoundingLimits(pMin, pMax)
-        r.bounding_limits = [pMin, pMax]
-        return r
+        info = SolidInfo(
+            cubic_volume=solid.GetCubicVolume(),
+            surface_area=solid.GetSurfaceArea(),
+            # plain floats rather than G4ThreeVector references
+            # so the cached info does not keep any G4 object alive
+            bounding_limits=(
+                (pMin.x, pMin.y, pMin.z),
+                (pMax.x, pMax.y, pMax.z),
+            ),
+            # immutable AABB size; computed once here instead of on every access
+            bounding_box_size=(
+                pMax.x - pMin.x,
+                pMax.y - pMin.y,
+                pMax.z - pMin.z,
+            ),
+        )
+        self._solid_info_cache = info
+        self._solid_info_cache_key = key
+        if key is not None:
+            if len(_solid_info_flyweight) >= _solid_info_flyweight_max_size:
+                # drop the oldest entry (dicts preserve insertion order)
+                _solid_info_flyweight.pop(next(iter(_solid_info_flyweight)))
+            _solid_info_flyweight[key] = info
+        return info
+
+    def _solid_info_key(self):
+        """Hashable key identifying this solid's geometry: the type plus all
+        user infos except the name. Returns None if any user info is not
+        plain data (e.g. the creator volumes of a boolean solid); such
+        solids are not cached at all.
+        """
+        try:
+            return (
+                type(self).__name__,
+                tuple(
+                    (k, _freeze_value(v))
+                    for k, v in self.user_info.items()
+                    if k != "name"
+                ),
+            )
+        except TypeError:
+            return None
 
     @property
     def bounding_limits(self):
         """
-        Return the min and max 3D points of the bounding box of the given volume
+        Return the min and max 3D points of the bounding box of the given volume,
+        as two tuples of plain floats.
         """
-        pMin, pMax = self.solid_info.bounding_limits
-        return pMin, pMax
+        return self.solid_info.bounding_limits
 
     @property
     def bounding_box_size(self):
         """
         Return the size of the bounding box of the given volume
         """
-        pMin, pMax = self.bounding_limits
-        return [pMax[0] - pMin[0], pMax[1] - pMin[1], pMax[2] - pMin[2]]
+        return self.solid_info.bounding_box_size
+
+    def bounding_box_overlaps(self, other):
+        """Check whether the axis-aligned bounding boxes of this solid and
+        another one overlap (both taken in their local reference frame).
+
+        This is a cheap rejection test based on the cached bounding limits;
+        it does not require any G4 geometry query.
+        """
+        p_min, p_max = self.bounding_limits
+        o_min, o_max = other.bounding_limits
+        return all(p_min[i] <= o_max[i] and o_min[i] <= p_max[i] for i in range(3))
 
     # The construct_solid method is implemented here, but will only work with objects
     # of the derived classes which implement the build_solid method,
@@ -136,16 +294,20 @@ class BooleanSolid(SolidBase):
 
 
 class BoxSolid(SolidBase):
+    g4_solid_constructor = g4.G4Box
+
     user_info_defaults = {
         "size": (
-            [10 * g4_units.cm, 10 * g4_units.cm, 10 * g4_units.cm],
+            [10 * cm, 10 * cm, 10 * cm],
             {"doc": "3 component list of side lengths of the box."},
         )
     }
 
     def build_solid(self):
-        return g4.G4Box(
-            self.name, self.size[0] / 2.0, self.size[1] / 2.0, self.size[2] / 2.0
+        # fetch the user info only once and multiply instead of dividing
+        size = self.size
+        return self.g4_solid_constructor(
+            self.name, 0.5 * size[0], 0.5 * size[1], 0.5 * size[2]
         )
 
 
@@ -158,33 +320,35 @@ class HexagonSolid(SolidBase):
 
     user_info_defaults = {
         "height": (
-            5 * g4_units.cm,
+            5 * cm,
             {"doc": "Height of the hexagon volume."},
         ),
         "radius": (
-            0.15 * g4_units.cm,
+            0.15 * cm,
             {"doc": "Radius from the center to corners."},
         ),
     }
 
+    g4_solid_constructor = g4.G4Polyhedra
+
+    # constant parameters of the hexagonal polyhedron,
+    # created once instead of on every build_solid call
+    num_side = 6
+    num_zplanes = 2
+    radius_inner = (0.0,) * num_side
+
     def build_solid(self):
-        deg = g4_units.deg
-        phi_start = 0 * deg
-        phi_total = 360 * deg
-        num_side = 6
-        num_zplanes = 2
         zplane = [-self.height / 2, self.height / 2]
-        radius_inner = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-        radius_outer = [self.radius] * num_side
+        radius_outer = (self.radius,) * self.num_side
 
-        return g4.G4Polyhedra(
+        return self.g4_solid_constructor(
             self.name,
-            phi_start,
-            phi_total,
-            num_side,
-            num_zplanes,
+            _full_circle_start,
+            _full_circle,
+            self.num_side,
+            self.num_zplanes,
             zplane,
-            radius_inner,
+            self.radius_inner,
             radius_outer,
         )
 
@@ -195,36 +359,38 @@ class ConsSolid(SolidBase):
 
     """
 
+    g4_solid_constructor = g4.G4Cons
+
     user_info_defaults = {
         "rmin1": (
-            5 * g4_units.mm,
+            5 * mm,
             {"doc": "Inner radius at the lower end."},
         ),
         "rmin2": (
-            20 * g4_units.mm,
+            20 * mm,
             {"doc": "Inner radius at the upper end."},
         ),
         "rmax1": (
-            10 * g4_units.mm,
+            10 * mm,
             {"doc": "Outer radius at the lower end."},
         ),
         "rmax2": (
-            25 * g4_units.mm,
+            25 * mm,
             {"doc": "Outer radius at the upper end."},
         ),
-        "dz": (40 * g4_units.mm, {"doc": "Half length in Z."}),
+        "dz": (40 * mm, {"doc": "Half length in Z."}),
         "sphi": (
-            0 * g4_units.deg,
+            0 * deg,
             {"doc": "Starting angle of the segment in radians."},
         ),
         "dphi": (
-            45 * g4_units.deg,
+            45 * deg,
             {"doc": "The angle of the segment in radians."},
         ),
     }
 
     def build_solid(self):
-        return g4.G4Cons(
+        return self.g4_solid_constructor(
             self.name,
             self.rmin1,
             self.rmax1,
@@ -242,19 +408,21 @@ class PolyhedraSolid(SolidBase):
 
     """
 
+    g4_solid_constructor = g4.G4Polyhedra
+
     user_info_defaults = {
         "phi_start": (
-            0 * g4_units.deg,
+            0 * deg,
             {"doc": "Initial Phi starting angle"},
         ),
         "phi_total": (
-            360 * g4_units.deg,
+            360 * deg,
             {"doc": "Total Phi angle"},
         ),
         "num_side": (6, {"doc": "Number of sides."}),
         "num_zplanes": (2, {"doc": "Number Z planes."}),
         "zplane": (
-            [-2.5 * g4_units.cm, 2.5 * g4_units.cm],
+            [-2.5 * cm, 2.5 * cm],
             {
                 "doc": "Position of Z planes. Should be a list with one position per plane."
             },
@@ -266,7 +434,7 @@ class PolyhedraSolid(SolidBase):
             },
         ),
         "radius_outer": (
-            [0.15 * g4_units.cm] * 6,
+            [0.15 * cm] * 6,
             {
                 "doc": "Tangent distance to outer surface. Should be a list with one distance per side."
             },
@@ -274,7 +442,7 @@ class PolyhedraSolid(SolidBase):
     }
 
     def build_solid(self):
-        return g4.G4Polyhedra(
+        return self.g4_solid_constructor(
             self.name,
             self.phi_start,
             self.phi_total,
@@ -287,23 +455,25 @@ class PolyhedraSolid(SolidBase):
 
 
 class SphereSolid(SolidBase):
+    g4_solid_constructor = g4.G4Sphere
+
     user_info_defaults = {
         "rmin": (0, {"doc": "Inner radius (0 means solid sphere)."}),
         "rmax": (
-            1 * g4_units.mm,
+            1 * mm,
             {"doc": "Outer radius of the sphere."},
         ),
         "sphi": (0, {"doc": ""}),
         "dphi": (
-            360 * g4_units.deg,
+            360 * deg,
             {"doc": "Angular size of the sphere section around the rotation axis. "},
         ),
         "stheta": (0, {"doc": ""}),
-        "dtheta": (180 * g4_units.deg, {"doc": ""}),
+        "dtheta": (180 * deg, {"doc": ""}),
     }
 
     def build_solid(self):
-        return g4.G4Sphere(
+        return self.g4_solid_constructor(
             self.name,
             self.rmin,
             self.rmax,
@@ -320,47 +490,49 @@ class TrapSolid(SolidBase):
 
     """
 
+    g4_solid_constructor = g4.G4Trap
+
     user_info_defaults = {
         "dx1": (
-            30 * g4_units.mm,
+            30 * mm,
             {"doc": "Half x length of the side at y=-pdy1 of the face at -pdz"},
         ),
         "dx2": (
-            40 * g4_units.mm,
+            40 * mm,
             {"doc": "Half x length of the side at y=+pdy1 of the face at -pdz"},
         ),
-        "dy1": (40 * g4_units.mm, {"doc": "Half y length at -pdz"}),
-        "dy2": (16 * g4_units.mm, {"doc": "Half y length at +pdz"}),
+        "dy1": (40 * mm, {"doc": "Half y length at -pdz"}),
+        "dy2": (16 * mm, {"doc": "Half y length at +pdz"}),
         "dx3": (
-            10 * g4_units.mm,
+            10 * mm,
             {"doc": "Half x length of the side at y=-pdy2 of the face at +pdz"},
         ),
         "dx4": (
-            14 * g4_units.mm,
+            14 * mm,
             {"doc": "Half x length of the side at y=+pdy2 of the face at +pdz"},
         ),
-        "dz": (60 * g4_units.mm, {"doc": "Half z length"}),
+        "dz": (60 * mm, {"doc": "Half z length"}),
         "theta": (
-            20 * g4_units.deg,
+            20 * deg,
             {
                 "doc": "Polar angle of the line joining the centres of the faces at -/+pdz"
             },
         ),
         "phi": (
-            5 * g4_units.deg,
+            5 * deg,
             {
                 "doc": "Azimuthal angle of the line joining the centre of the face at -pdz "
                 "to the centre of the face at +pdz"
             },
         ),
         "alp1": (
-            10 * g4_units.deg,
+            10 * deg,
             {
                 "doc": "Angle with respect to the y axis from the centre of the side (lower endcap)"
             },
         ),
         "alp2": (
-            10 * g4_units.deg,
+            10 * deg,
             {
                 "doc": "Angle with respect to the y axis from the centre of the side (upper endcap)"
             },
@@ -368,7 +540,7 @@ class TrapSolid(SolidBase):
     }
 
     def build_solid(self):
-        return g4.G4Trap(
+        return self.g4_solid_constructor(
             self.name,
             self.dz,
             self.theta,
@@ -396,31 +568,35 @@ class TrdSolid(SolidBase):
 
     """
 
+    g4_solid_constructor = g4.G4Trd
+
     user_info_defaults = {
         "dx1": (
-            30 * g4_units.mm,
+            30 * mm,
             {"doc": "Half-length along X at the surface positioned at -dz"},
         ),
         "dx2": (
-            10 * g4_units.mm,
+            10 * mm,
             {"doc": "dx2 Half-length along X at the surface positioned at +dz"},
         ),
         "dy1": (
-            40 * g4_units.mm,
+            40 * mm,
             {"doc": "dy1 Half-length along Y at the surface positioned at -dz"},
         ),
         "dy2": (
-            15 * g4_units.mm,
+            15 * mm,
             {"doc": "dy2 Half-length along Y at the surface positioned at +dz"},
         ),
         "dz": (
-            15 * g4_units.mm,
+            15 * mm,
             {"doc": "Half-length along Z axis"},
         ),
     }
 
     def build_solid(self):
-        return g4.G4Trd(self.name, self.dx1, self.dx2, self.dy1, self.dy2, self.dz)
+        return self.g4_solid_constructor(
+            self.name, self.dx1, self.dx2, self.dy1, self.dy2, self.dz
+        )
 
 
 class TubsSolid(SolidBase):
@@ -429,16 +605,20 @@ class TubsSolid(SolidBase):
 
     """
 
+    g4_solid_constructor = g4.G4Tubs
+
     user_info_defaults = {
-        "rmin": (30 * g4_units.mm, {"doc": "Inner radius"}),
-        "rmax": (40 * g4_units.mm, {"doc": "Outer radius"}),
-        "dz": (40 * g4_units.mm, {"doc": "Half length along Z"}),
-        "sphi": (0 * g4_units.deg, {"doc": "Start angle phi"}),
-        "dphi": (360 * g4_units.deg, {"doc": "Angle segment"}),
+        "rmin": (30 * mm, {"doc": "Inner radius"}),
+        "rmax": (40 * mm, {"doc": "Outer radius"}),
+        "dz": (40 * mm, {"doc": "Half length along Z"}),
+        "sphi": (0 * deg, {"doc": "Start angle phi"}),
+        "dphi": (360 * deg, {"doc": "Angle segment"}),
     }
 
     def build_solid(self):
-        return g4.G4Tubs(self.name, self.rmin, self.rmax, self.dz, self.sphi, self.dphi)
+        return self.g4_solid_constructor(
+            self.name, self.rmin, self.rmax, self.dz, self.sphi, self.dphi
+        )
 
 
 class ImageSolid(SolidBase):
@@ -466,6 +646,19 @@ class ImageSolid(SolidBase):
         self.g4_solid_y = None
         self.g4_solid_z = None
 
+    def __getstate__(self):
+        return_dict = super().__getstate__()
+        return_dict["g4_solid_x"] = None
+        return_dict["g4_solid_y"] = None
+        return_dict["g4_solid_z"] = None
+        return return_dict
+
+    def _mark_dirty(self):
+        super()._mark_dirty()
+        self.g4_solid_x = None
+        self.g4_solid_y = None
+        self.g4_solid_z = None
+
     @requires_fatal("half_size_mm")
     @requires_fatal("half_spacing")
     def construct_solid(self):
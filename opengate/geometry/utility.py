@@ -22,6 +22,17 @@ def cons_add_size(cons, thickness):
     cons.dz += thickness
 
 
+def get_bounding_box_sizes(volumes):
+    """Return the bounding box sizes of several volumes as an (n, 3) numpy array.
+
+    The bounding limits of all volumes are gathered into a single array and the
+    sizes are obtained with one vectorized subtraction, instead of computing
+    them volume by volume in a Python loop.
+    """
+    limits = np.array([v.bounding_limits for v in volumes])  # shape (n, 2, 3)
+    return limits[:, 1, :] - limits[:, 0, :]
+
+
 def translate_point_to_volume(simulation, volume, top, x):
     """
 
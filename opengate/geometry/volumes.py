@@ -241,7 +241,7 @@ class VolumeBase(GateObject, NodeMixin):
 
     def _request_volume_tree_update(self):
         try:
-            self.volume_manager.update_volume_tree()
+            self.volume_manager.update_volume_tree_if_needed()
         except AttributeError:
             fatal(
                 f"Unable to determine the world volume to which volume named {self.name} belongs. "
@@ -255,13 +255,6 @@ class VolumeBase(GateObject, NodeMixin):
     @property
     def world_volume(self):
         self._request_volume_tree_update()
-        try:
-            self.volume_manager.update_volume_tree()
-        except AttributeError:
-            fatal(
-                f"Unable to determine the world volume to which volume named {self.name} belongs. "
-                "Probably the volume has not yet been added to the simulation. "
-            )
         try:
             return self.ancestors[
                 1
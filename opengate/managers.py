@@ -1,13 +1,15 @@
+import hashlib
+import pickle
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 
 from box import Box
-from anytree import RenderTree, LoopError
 import shutil
 import opengate_core as g4
 import os
 from pathlib import Path
-import itk
 
 from .base import (
     GateObject,
@@ -60,6 +62,14 @@ from .geometry.volumes import (
 )
 
 
+# Optical properties file shipped with Gate, used as default by the
+# PhysicsManager. Computed once at import time.
+default_optical_properties_file = (
+    Path(__file__).parent / "data" / "OpticalProperties.xml"
+)
+
+
+@lru_cache(maxsize=None)
 def retrieve_g4_physics_constructor_class(g4_physics_constructor_class_name):
     """
     Dynamically create a class with the given PhysicList
@@ -109,11 +119,52 @@ def init_method(self, verbosity):
     self.RegisterPhysics(self.g4_physics_constructor)
 
 
+# Registry of the dynamically created physics list classes.
+# They carry no instance state, so one registry is shared by all
+# PhysicsListManager instances and only built once per process.
+_created_physics_list_classes = None
+
+# Cache of voxelized geometries keyed by a hash of the volume tree and
+# the voxelization parameters. Voxelization runs a full G4 geometry
+# construction in a subprocess, so repeated calls with identical
+# geometry (e.g. while iterating on sources or actors) are served from
+# the cache. The entries are stored pickled and unpickled per hit, so
+# every caller gets its own labels dict and itk image and cannot
+# corrupt later hits by mutating the returned objects.
+_voxelized_geometry_cache = {}
+# bound the cache: voxelized images can be large
+_voxelized_geometry_cache_max_size = 4
+
+
+# Shared G4PhysListFactory instance; the factory is stateless from our
+# point of view and cheap to query, so one per process is enough.
+_g4_physics_list_factory = None
+
+
+def get_g4_physics_list_factory():
+    global _g4_physics_list_factory
+    if _g4_physics_list_factory is None:
+        _g4_physics_list_factory = g4.G4PhysListFactory()
+    return _g4_physics_list_factory
+
+
+def get_created_physics_list_classes():
+    global _created_physics_list_classes
+    if _created_physics_list_classes is None:
+        _created_physics_list_classes = {
+            g4pc_name: create_modular_physics_list_class(g4pc_name)
+            for g4pc_name in PhysicsListManager.available_g4_physics_constructors
+        }
+    return _created_physics_list_classes
+
+
 class FilterManager:
     """
     Manage all the Filters in the simulation
     """
 
+    __slots__ = ["simulation", "user_info_filters", "filters"]
+
     def __init__(self, simulation):
         self.simulation = simulation
         self.user_info_filters = {}
@@ -157,7 +208,7 @@ class FilterManager:
     def initialize(self):
         for ui in self.user_info_filters.values():
             filter = new_element(ui, self.simulation)
-            log.debug(f"Filter: initialize [{ui.type_name}] {ui.name}")
+            log.debug("Filter: initialize [%s] %s", ui.type_name, ui.name)
             filter.Initialize(ui)
             self.filters[ui.name] = filter
 
@@ -169,6 +220,13 @@ class SourceManager:
     the main run loop to set the current time and source.
     """
 
+    __slots__ = [
+        "simulation",
+        "run_timing_intervals",
+        "current_run_interval",
+        "user_info_sources",
+    ]
+
     def __init__(self, simulation):
         # Keep a pointer to the current simulation
         self.simulation = simulation
@@ -256,6 +314,8 @@ class ActorManager:
     Manage all the actors in the simulation
     """
 
+    __slots__ = ["simulation", "user_info_actors"]
+
     def __init__(self, simulation):
         self.simulation = simulation
         self.user_info_actors = {}
@@ -347,7 +407,7 @@ class PhysicsListManager(GateObject):
 
     def __getstate__(self):
         # This is needed because cannot be pickled.
-        dict_to_return = dict([(k, v) for k, v in self.__dict__.items()])
+        dict_to_return = dict(self.__dict__)
         dict_to_return["created_physics_list_classes"] = None
         return dict_to_return
 
@@ -356,11 +416,8 @@ class PhysicsListManager(GateObject):
         self.create_physics_list_classes()
 
     def create_physics_list_classes(self):
-        self.created_physics_list_classes = {}
-        for g4pc_name in self.available_g4_physics_constructors:
-            self.created_physics_list_classes[
-                g4pc_name
-            ] = create_modular_physics_list_class(g4pc_name)
+        # the classes are created once per process and shared across managers
+        self.created_physics_list_classes = get_created_physics_list_classes()
 
     def get_physics_list(self, physics_list_name):
         if physics_list_name in self.created_physics_list_classes:
@@ -368,7 +425,7 @@ class PhysicsListManager(GateObject):
                 self.physics_manager.simulation.g4_verbose_level
             )
         else:
-            g4_factory = g4.G4PhysListFactory()
+            g4_factory = get_g4_physics_list_factory()
             if g4_factory.IsReferencePhysList(physics_list_name):
                 physics_list = g4_factory.GetReferencePhysList(physics_list_name)
             else:
@@ -398,7 +455,7 @@ class PhysicsListManager(GateObject):
         return physics_list
 
     def dump_info_physics_lists(self):
-        g4_factory = g4.G4PhysListFactory()
+        g4_factory = get_g4_physics_list_factory()
         s = (
             "\n**** INFO about GATE physics lists ****\n"
             f"* Known Geant4 lists are: {g4_factory.AvailablePhysLists()}\n"
@@ -445,7 +502,7 @@ class PhysicsManager(GateObject):
             },
         ),
         "optical_properties_file": (
-            Path(os.path.dirname(__file__)) / "data" / "OpticalProperties.xml",
+            default_optical_properties_file,
             {
                 "doc": "Path to the xml file containing the optical material properties to be used by G4OpticalPhysics. "
                 "Default: file shipped with Gate.",
@@ -521,7 +578,7 @@ class PhysicsManager(GateObject):
 
     def to_dictionary(self):
         d = super().to_dictionary()
-        d["regions"] = dict([(k, v.to_dictionary()) for k, v in self.regions.items()])
+        d["regions"] = {k: v.to_dictionary() for k, v in self.regions.items()}
         return d
 
     def from_dictionary(self, d):
@@ -541,7 +598,7 @@ class PhysicsManager(GateObject):
         if self.simulation.verbose_getstate:
             warning("Getstate PhysicsManager")
 
-        dict_to_return = dict([(k, v) for k, v in self.__dict__.items()])
+        dict_to_return = dict(self.__dict__)
         dict_to_return["physics_list_manager"] = None
         return dict_to_return
 
@@ -603,6 +660,9 @@ class PhysicsManager(GateObject):
         self.special_physics_constructors["G4RadioactiveDecayPhysics"] = value
 
     def add_region(self, name):
+        # intern the name: region names are used as dict keys in many
+        # lookups, interned strings compare by identity
+        name = sys.intern(name)
         if name in self.regions.keys():
             fatal("A region with this name already exists.")
         self.regions[name] = Region(name=name, physics_manager=self)
@@ -629,30 +689,30 @@ class PhysicsManager(GateObject):
     # with a region. If it does not yet have one, created it.
     # Outlook: These setter methods might be linked to properties
     # implemented in a future version of the Volume class
-    def set_max_step_size(self, volume_name, max_step_size):
+    def _set_user_limit(self, volume_name, limit_name, value):
+        """Data-driven implementation shared by all set_* user limit methods."""
         region = self.find_or_create_region(volume_name)
-        region.user_limits["max_step_size"] = max_step_size
+        region.user_limits[limit_name] = value
+
+    def set_max_step_size(self, volume_name, max_step_size):
+        self._set_user_limit(volume_name, "max_step_size", max_step_size)
 
     def set_max_track_length(self, volume_name, max_track_length):
-        region = self.find_or_create_region(volume_name)
-        region.user_limits["max_track_length"] = max_track_length
+        self._set_user_limit(volume_name, "max_track_length", max_track_length)
 
     def set_min_ekine(self, volume_name, min_ekine):
-        region = self.find_or_create_region(volume_name)
-        region.user_limits["min_ekine"] = min_ekine
+        self._set_user_limit(volume_name, "min_ekine", min_ekine)
 
     def set_max_time(self, volume_name, max_time):
-        region = self.find_or_create_region(volume_name)
-        region.user_limits["max_time"] = max_time
+        self._set_user_limit(volume_name, "max_time", max_time)
 
     def set_min_range(self, volume_name, min_range):
-        region = self.find_or_create_region(volume_name)
-        region.user_limits["min_range"] = min_range
+        self._set_user_limit(volume_name, "min_range", min_range)
 
     def set_user_limits_particles(self, particle_names):
         if not isinstance(particle_names, (list, set, tuple)):
-            particle_names = list([particle_names])
-        for pn in list(particle_names):
+            particle_names = [particle_names]
+        for pn in particle_names:
             # try to get current value to check if particle_name is eligible
             try:
                 _ = self.user_info.user_limits_particles[pn]
@@ -714,6 +774,12 @@ class VolumeManager(GateObject):
         self.parallel_world_volumes = {}
 
         self._need_tree_update = True  # flag to store state of volume tree
+        # cache for the concatenated volume name list; rebuilt on demand
+        # whenever a volume or parallel world is added
+        self._all_volume_names_cache = None
+        # cache for the rendered volume tree string; cleared whenever the
+        # tree is rebuilt or a volume is added
+        self._tree_dump_cache = None
 
         # database of materials
         self.material_database = MaterialDatabase()
@@ -733,7 +799,7 @@ class VolumeManager(GateObject):
 
     def to_dictionary(self):
         d = super().to_dictionary()
-        d["volumes"] = dict([(k, v.to_dictionary()) for k, v in self.volumes.items()])
+        d["volumes"] = {k: v.to_dictionary() for k, v in self.volumes.items()}
         d["parallel_world_volumes"] = list(self.parallel_world_volumes.keys())
         return d
 
@@ -741,9 +807,10 @@ class VolumeManager(GateObject):
         self.reset()
         super().from_dictionary(d)
         # First create all volumes
+        world_name = self.world_volume.name
         for k, v in d["volumes"].items():
             # the world volume is always created in __init__
-            if v["user_info"]["name"] != self.world_volume.name:
+            if v["user_info"]["name"] != world_name:
                 self.add_volume(v["object_type"], name=v["user_info"]["name"])
         # ... then process them to make sure that any reference
         #  to a volume in the volumes dictionary is satisfied
@@ -771,7 +838,10 @@ class VolumeManager(GateObject):
 
     @property
     def all_volume_names(self):
-        return self.volume_names + self.parallel_world_names
+        if self._all_volume_names_cache is None:
+            self._all_volume_names_cache = self.volume_names + self.parallel_world_names
+        # return a copy so callers cannot mutate the cached list
+        return list(self._all_volume_names_cache)
 
     def get_volume(self, volume_name):
         try:
@@ -790,18 +860,46 @@ class VolumeManager(GateObject):
             self.update_volume_tree()
 
     def update_volume_tree(self):
+        # build the set of world volumes once; testing membership against
+        # parallel_world_volumes.values() inside the loop would rescan the
+        # dict values for every volume
+        world_volumes = set(self.parallel_world_volumes.values())
+        world_volumes.add(self.world_volume)
+        self._check_volume_tree_for_loops(world_volumes)
         for v in self.volumes.values():
-            if (
-                v not in self.parallel_world_volumes.values()
-                and v is not self.world_volume
-            ):
-                try:
-                    v._update_node()
-                except LoopError:
+            if v not in world_volumes:
+                v._update_node()
+        self._need_tree_update = False
+        self._tree_dump_cache = None
+
+    def _check_volume_tree_for_loops(self, world_volumes):
+        """Walk the mother chain of every volume and make sure it reaches
+        a world volume. Each volume is visited only once across all chains,
+        so the whole check is O(number of volumes).
+        """
+        verified = {v.name for v in world_volumes}
+        for v in self.volumes.values():
+            if v in world_volumes:
+                continue
+            chain = []
+            chain_names = set()
+            current = v
+            while current.name not in verified:
+                if current.name in chain_names:
                     fatal(
-                        f"There seems to be a loop in the volume tree involving volume {v.name}."
+                        f"There seems to be a loop in the volume tree involving volume {current.name}."
                     )
-        self._need_tree_update = False
+                chain.append(current.name)
+                chain_names.add(current.name)
+                mother = self.volumes.get(current.mother)
+                if mother is None:
+                    mother = self.parallel_world_volumes.get(current.mother)
+                if mother is None:
+                    # missing mother volume; _update_node reports this
+                    # with a detailed message
+                    break
+                current = mother
+            verified.update(chain)
 
     def add_volume(self, volume, name=None):
         if isinstance(volume, str):
@@ -815,35 +913,51 @@ class VolumeManager(GateObject):
                 "You need to either provide a volume type and name, or a volume object."
             )
 
-        if new_volume.name in self.all_volume_names:
+        # constant-time membership tests on the two dictionaries
+        # (all_volume_names would rebuild a list on every add)
+        if (
+            new_volume.name in self.volumes
+            or new_volume.name in self.parallel_world_volumes
+        ):
             fatal(
                 f"The volume name {new_volume.name} already exists. Existing volume names are: {self.volumes.keys()}"
             )
-        self.volumes[new_volume.name] = new_volume
-        self.volumes[new_volume.name].volume_manager = self
+        # intern the name: volume names are used as dict keys all over the
+        # place (volumes, regions, user limits), interned strings compare
+        # by identity
+        volume_name = sys.intern(new_volume.name)
+        self.volumes[volume_name] = new_volume
+        self.volumes[volume_name].volume_manager = self
         self._need_tree_update = True
+        self._all_volume_names_cache = None
+        self._tree_dump_cache = None
         # return the volume if it has not been passed as input, i.e. it was created here
         if new_volume is not volume:
             return new_volume
 
     def create_volume(self, volume_type, name):
-        # check that another element with the same name does not already exist
-        volume_type_variants = [volume_type, volume_type + "Volume"]
-        for vt in volume_type_variants:
-            if vt in self.volume_types.keys():
-                return self.volume_types[vt](name=name)
-        fatal(
-            f"Unknown volume type {volume_type}. Known types are: {list(self.volume_types.keys())}."
-        )
+        # the type can be given with or without the 'Volume' suffix;
+        # two direct dict lookups instead of a scan over the variants
+        cls = self.volume_types.get(volume_type)
+        if cls is None:
+            cls = self.volume_types.get(volume_type + "Volume")
+        if cls is None:
+            fatal(
+                f"Unknown volume type {volume_type}. Known types are: {list(self.volume_types.keys())}."
+            )
+        return cls(name=name)
 
     def add_parallel_world(self, name):
-        if name in self.all_volume_names:
+        if name in self.volumes or name in self.parallel_world_volumes:
             fatal(
                 f"Cannot create the parallel world named {name} because it already exists."
             )
         # constructor needs self, i.e. the volume manager
+        name = sys.intern(name)
         self.parallel_world_volumes[name] = ParallelWorldVolume(name, self)
         self._need_tree_update = True
+        self._all_volume_names_cache = None
+        self._tree_dump_cache = None
 
     def _simulation_engine_closing(self):
         """
@@ -854,7 +968,7 @@ class VolumeManager(GateObject):
         # self.volumes_user_info = None
 
     def add_material_database(self, filename):
-        if filename in self.material_database.filenames:
+        if filename in self.material_database._filenames_set:
             fatal(f'Database "{filename}" already exist.')
         self.material_database.read_from_file(filename)
 
@@ -862,24 +976,25 @@ class VolumeManager(GateObject):
         return self.material_database.FindOrBuildMaterial(material)
 
     def dump_volumes(self):
-        s = f"Number of volumes: {len(self.volumes)}"
-        for vol in self.volumes.values():
-            s += indent(2, f"\n{vol}")
-        return s
+        parts = [f"Number of volumes: {len(self.volumes)}"]
+        parts.extend(indent(2, f"\n{vol}") for vol in self.volumes.values())
+        return "".join(parts)
 
     def dump_volume_tree(self):
         self.update_volume_tree_if_needed()
-        s = ""
-        for pre, _, node in RenderTree(self.volume_tree_root):
-            # FIXME: pre should be used directly but cannot be encoded correctly in Windows
-            s += len(pre) * " " + f"{node.name}\n"
-        return s
+        if self._tree_dump_cache is None:
+            # deferred import: only needed when the tree is dumped
+            from anytree import RenderTree
+
+            lines = []
+            for pre, _, node in RenderTree(self.volume_tree_root):
+                # FIXME: pre should be used directly but cannot be encoded correctly in Windows
+                lines.append(len(pre) * " " + f"{node.name}\n")
+            self._tree_dump_cache = "".join(lines)
+        return self._tree_dump_cache
 
     def dump_volume_types(self):
-        s = f""
-        for vt in self.volume_types:
-            s += f"{vt} "
-        return s
+        return "".join(f"{vt} " for vt in self.volume_types)
 
     def dump_material_database_names(self):
         return list(self.material_database.filenames)
@@ -1071,11 +1186,11 @@ class Simulation(GateObject):
         self.verbose_close = False
 
         # main managers
+        # volume and physics managers are always needed (world volume,
+        # regions); the other managers are created lazily on first access
+        # via cached_property
         self.volume_manager = VolumeManager(self)
-        self.source_manager = SourceManager(self)
-        self.actor_manager = ActorManager(self)
         self.physics_manager = PhysicsManager(self)
-        self.filter_manager = FilterManager(self)
 
         # output of the simulation (once run)
         self.output = None
@@ -1094,6 +1209,18 @@ class Simulation(GateObject):
         )
         return s
 
+    @cached_property
+    def source_manager(self):
+        return SourceManager(self)
+
+    @cached_property
+    def actor_manager(self):
+        return ActorManager(self)
+
+    @cached_property
+    def filter_manager(self):
+        return FilterManager(self)
+
     @property
     def use_multithread(self):
         return self.number_of_threads > 1 or self.force_multithread_mode
@@ -1158,24 +1285,26 @@ class Simulation(GateObject):
         directory = self.get_output_path(directory, is_file_or_directory="d")
         if dct is None:
             dct = self.to_dictionary()
-        input_files = []
+        # use a set: a file referenced by several objects
+        # (e.g. a shared material db) should only be copied once
+        input_files = set()
         for go_dict in find_all_gate_objects(dct):
-            input_files.extend(
-                [
-                    p
-                    for p in find_paths_in_gate_object_dictionary(
-                        go_dict, only_input_files=True
-                    )
-                    if p.is_file() is True
-                ]
+            input_files.update(
+                p
+                for p in find_paths_in_gate_object_dictionary(
+                    go_dict, only_input_files=True
+                )
+                if p.is_file() is True
             )
-        # post process the list
-        for f in input_files:
-            # check for image header files (mhd) and add the corresponding raw files to the list
+        # check for image header files (mhd) and add the corresponding raw files
+        for f in list(input_files):
             if f.suffix == ".mhd":
-                input_files.append(f.parent.absolute() / Path(f.stem + ".raw"))
-        for f in input_files:
-            shutil.copy2(f, directory)
+                input_files.add(f.parent.absolute() / Path(f.stem + ".raw"))
+        # the copies are I/O bound, so run them in a thread pool
+        with ThreadPoolExecutor() as executor:
+            # iterate over the results so exceptions are re-raised here
+            for _ in executor.map(lambda f: shutil.copy2(f, directory), input_files):
+                pass
 
     def get_output_path(self, path=None, is_file_or_directory="file"):
         if path is None:
@@ -1192,14 +1321,12 @@ class Simulation(GateObject):
                 p_out = p
 
         # Make sure the directory exists
+        directory = None
         if is_file_or_directory in ["file", "File", "f"]:
-            n = len(p_out.parts) - 1  # last item is the filename
+            directory = p_out.parent  # last item is the filename
         elif is_file_or_directory in ["dir", "Dir", "directory", "d"]:
-            n = len(p_out.parts)  # all items are part of the directory
-        if len(p_out.parts) > 0:
-            directory = Path(p_out.parts[0])
-            for i in range(n - 1):
-                directory /= p_out.parts[i + 1]
+            directory = p_out  # all items are part of the directory
+        if directory is not None:
             ensure_directory_exists(directory)
 
         return p_out.absolute()
@@ -1327,13 +1454,43 @@ class Simulation(GateObject):
         # collect volumes which are directly underneath the world/parallel worlds
         if extent in ("auto", "Auto"):
             self.volume_manager.update_volume_tree_if_needed()
-            extent = list(self.volume_manager.world_volume.children)
-            for pw in self.volume_manager.parallel_world_volumes.values():
-                extent.extend(list(pw.children))
-
-        labels, image = dispatch_to_subprocess(
-            self._get_voxelized_geometry, extent, spacing, margin
-        )
+            # one pass over all worlds (mass world and parallel worlds)
+            extent = [
+                child
+                for world in self.volume_manager.all_world_volumes
+                for child in world.children
+            ]
+
+        # represent the extent in a json-serializable way for the cache key
+        if isinstance(extent, VolumeBase):
+            extent_repr = [extent.name]
+        elif isinstance(extent, __gate_list_objects__) and all(
+            [isinstance(e, VolumeBase) for e in extent]
+        ):
+            extent_repr = [e.name for e in extent]
+        else:
+            extent_repr = extent
+        key = hashlib.sha1(
+            dumps_json(
+                {
+                    "volumes": self.volume_manager.to_dictionary(),
+                    "extent": extent_repr,
+                    "spacing": list(spacing),
+                    "margin": margin,
+                }
+            ).encode()
+        ).hexdigest()
+        try:
+            # unpickle per hit -> defensive copies of labels and image
+            labels, image = pickle.loads(_voxelized_geometry_cache[key])
+        except KeyError:
+            labels, image = dispatch_to_subprocess(
+                self._get_voxelized_geometry, extent, spacing, margin
+            )
+            if len(_voxelized_geometry_cache) >= _voxelized_geometry_cache_max_size:
+                # drop the oldest entry (dicts preserve insertion order)
+                _voxelized_geometry_cache.pop(next(iter(_voxelized_geometry_cache)))
+            _voxelized_geometry_cache[key] = pickle.dumps((labels, image))
 
         if filename is not None:
             outpath = self.get_output_path(filename)
@@ -1345,7 +1502,9 @@ class Simulation(GateObject):
             with open(outpath_json, "w") as outfile:
                 dump_json(labels, outfile, indent=4)
 
-            # write image
+            # write image (deferred import: itk is only needed here)
+            import itk
+
             itk.imwrite(image, ensure_filename_is_str(outpath_mhd))
         else:
             outpath_mhd = "not_applicable"
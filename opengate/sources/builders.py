@@ -1,8 +1,3 @@
-from .generic import GenericSource, TemplateSource
-from .voxelsources import VoxelsSource
-from .gansources import GANSource, GANPairsSource
-from .beamsources import IonPencilBeamSource
-from .phspsources import PhaseSpaceSource
 from ..utility import make_builders
 
 
@@ -12,13 +7,43 @@ from ..utility import make_builders
     Energy spectra for beta+ emitters
 """
 
-source_type_names = {
-    GenericSource,
-    VoxelsSource,
-    GANSource,
-    GANPairsSource,
-    IonPencilBeamSource,
-    TemplateSource,
-    PhaseSpaceSource,
-}
-source_builders = make_builders(source_type_names)
+# Cache for the lazily imported source types and builders.
+# The source modules pull in heavy dependencies (opengate_core, numpy),
+# so they are only imported when the source types are actually needed,
+# not when this module is loaded.
+_source_type_names = None
+_source_builders = None
+
+
+def _import_source_type_names():
+    from .generic import GenericSource, TemplateSource
+    from .voxelsources import VoxelsSource
+    from .gansources import GANSource, GANPairsSource
+    from .beamsources import IonPencilBeamSource
+    from .phspsources import PhaseSpaceSource
+
+    return {
+        GenericSource,
+        VoxelsSource,
+        GANSource,
+        GANPairsSource,
+        IonPencilBeamSource,
+        TemplateSource,
+        PhaseSpaceSource,
+    }
+
+
+def __getattr__(name):
+    """Module-level getattr (PEP 562) which imports the source modules
+    only on first access to source_type_names or source_builders.
+    """
+    global _source_type_names, _source_builders
+    if name == "source_type_names":
+        if _source_type_names is None:
+            _source_type_names = _import_source_type_names()
+        return _source_type_names
+    if name == "source_builders":
+        if _source_builders is None:
+            _source_builders = make_builders(__getattr__("source_type_names"))
+        return _source_builders
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
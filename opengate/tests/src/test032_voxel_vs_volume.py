@@ -84,7 +84,6 @@ if __name__ == "__main__":
     # Coordinate system of iec2 is the center of the image bounding box
     img = itk.imread(str(iec2.image))
     fake1 = gate.image.create_image_like(img)
-    pMin = gate.geometry.utility.vec_g4_as_np(pMin)
     fake1.SetOrigin(pMin)
 
     fake2 = gate.image.create_image_like(img)
@@ -5,7 +5,6 @@ import random
 from box import Box
 import textwrap
 import inspect
-import pkg_resources
 import sys
 from pathlib import Path
 import string
@@ -35,9 +34,8 @@ def assert_equal_dic(d1, d2, name=""):
 
 
 def ensure_directory_exists(directory):
-    p = Path(directory)
-    if p.exists() is False:
-        p.mkdir(parents=True)
+    # exist_ok avoids a separate exists() stat call and is race-free
+    Path(directory).mkdir(parents=True, exist_ok=True)
 
 
 g4_units = Box()
@@ -127,10 +125,8 @@ def make_builders(class_names):
 def read_mac_file_to_commands(filename):
     # read a file located into the 'mac' folder of the source code
     # return a list of commands
-    resource_package = __name__
-    resource_path = "/".join(("mac", filename))  # Do not use os.filename.join()
-    template = pkg_resources.resource_string(resource_package, resource_path)
-    c = template.decode("utf-8")
+    path = Path(__file__).parent / "mac" / filename
+    c = path.read_text(encoding="utf-8")
     commands = []
     for s in c.split("\n"):
         if s == "":